@@ -0,0 +1,36 @@
+"""
+Cosmos CUDA Kernels
+====================
+
+The CUDA kernel behind cosmos.propagate.positions_cuda(). It is only imported
+by that function, so the CUDA toolkit is not loaded otherwise.
+"""
+
+import numpy as np
+from numba import cuda
+
+from cosmos._jit import _position
+
+# Threads per block for the CUDA kernel.
+CUDA_THREADS = 256
+
+# The same solve as _position, compiled for the device.
+_position_device = cuda.jit(device=True)(_position.py_func)
+
+
+@cuda.jit
+def propagate_cuda(sma, ecc, incl, period, times, out):
+    """
+    Writes the x, y, z position of every body at every time into out, an
+    (times, n, 3) array, with one thread per (time, body) pair.
+    """
+    i = cuda.grid(1)
+    n = sma.shape[0]
+    if i < times.shape[0] * n:
+        step = i // n
+        body = i - step * n
+        # Inputs may be float32; the solve itself stays in float64.
+        out[step, body, 0], out[step, body, 1], out[step, body, 2] = (
+            _position_device(sma[body], np.float64(ecc[body]),
+                             np.float64(incl[body]), period[body],
+                             times[step]))
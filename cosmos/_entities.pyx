@@ -0,0 +1,47 @@
+# cython: language_level=3
+"""
+Cosmos Entities Extension
+==========================
+
+C implementations of the bulk steps in building a StarSystem. Build them with
+`python setup.py build_ext --inplace`; cosmos.entities uses them when present.
+"""
+
+import numpy as np
+
+
+def group_children(const int[::1] parent_ids):
+    """
+    Groups bodies by parent into a compressed sparse row index with a single
+    counting sort, keeping satellites in their original order.
+
+    Parameters:
+    parent_ids (ndarray): int32 id of each body's parent, or -1 if it has none.
+
+    Returns:
+    tuple: (offsets, ids); the satellites of body i are
+    ids[offsets[i]:offsets[i + 1]].
+    """
+    cdef Py_ssize_t i, n = parent_ids.shape[0]
+    cdef int parent
+
+    offsets = np.zeros(n + 1, dtype=np.int32)
+    cdef int[::1] offsets_view = offsets
+    for i in range(n):
+        parent = parent_ids[i]
+        if parent >= 0:
+            offsets_view[parent + 1] += 1
+    for i in range(n):
+        offsets_view[i + 1] += offsets_view[i]
+
+    ids = np.empty(offsets_view[n], dtype=np.int32)
+    cdef int[::1] ids_view = ids
+    cursor = offsets[:n].copy()
+    cdef int[::1] cursor_view = cursor
+    for i in range(n):
+        parent = parent_ids[i]
+        if parent >= 0:
+            ids_view[cursor_view[parent]] = i
+            cursor_view[parent] += 1
+
+    return offsets, ids
@@ -0,0 +1,120 @@
+"""
+Cosmos JIT Kernels
+===================
+
+Numba implementations of the propagation kernels in cosmos.propagate. This
+module is only imported when a kernel needs it, so cosmos.propagate can be
+used without Numba once the C extension in cosmos._kepler is built.
+"""
+
+import math
+
+import numba
+import numpy as np
+
+# Fixed number of Newton iterations on Kepler's equation.
+NEWTON_ITERATIONS = 5
+
+# One full orbit in radians. Read as a global so the kernel folds it in.
+TAU = math.tau
+
+
+@numba.njit(fastmath=True, cache=True)
+def _eccentric_anomaly(M: float, e: float) -> float:
+    """
+    Solves Kepler's Equation (E - e * sin(E) = M) for E with a fixed number of
+    Newton iterations, starting from E = M.
+    """
+    E = M
+    for _ in range(NEWTON_ITERATIONS):
+        E = E - (E - e * math.sin(E) - M) / (1.0 - e * math.cos(E))
+    return E
+
+
+@numba.njit(fastmath=True, cache=True)
+def _position(a: float,
+              e: float,
+              incl: float,
+              period: float,
+              t: float) -> tuple:
+    """
+    Returns the x, y, z position at time t of a body on the given orbit.
+    """
+    if period == 0.0:
+        return 0.0, 0.0, 0.0
+
+    # Mean anomaly (M = n(t - T₀)), assuming T₀ = 0
+    M = TAU / period * t
+
+    E = _eccentric_anomaly(M, e)
+
+    # True anomaly (ν) and radial distance (r)
+    v = 2.0 * math.atan(math.sqrt((1.0 + e) / (1.0 - e)) * math.tan(E / 2.0))
+    r = a * (1.0 - e * math.cos(E))
+
+    # Rotate the orbital plane by the inclination about the line of nodes.
+    sv = math.sin(v)
+    i = math.radians(incl)
+    return r * math.cos(v), r * sv * math.cos(i), r * sv * math.sin(i)
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def propagate_jit(sma: np.ndarray,
+                  ecc: np.ndarray,
+                  incl: np.ndarray,
+                  period: np.ndarray,
+                  t: float,
+                  out: np.ndarray) -> None:
+    """
+    Writes the x, y, z position of every body at time t into out.
+
+    Parameters:
+    sma (ndarray): float64 semi-major axis of each body.
+    ecc (ndarray): float32 eccentricity of each body.
+    incl (ndarray): float32 inclination of each body in degrees.
+    period (ndarray): float64 orbital period of each body in days. Bodies
+    with a period of 0 do not orbit and are placed at the origin.
+    t (float): the time in days.
+    out (ndarray): an (n, 3) array receiving the positions.
+    """
+    for i in numba.prange(sma.shape[0]):
+        # Inputs may be float32; the solve itself stays in float64.
+        out[i, 0], out[i, 1], out[i, 2] = _position(
+            sma[i], np.float64(ecc[i]), np.float64(incl[i]), period[i], t)
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def propagate_tiles(tiles: np.ndarray, t: float, out: np.ndarray) -> None:
+    """
+    Writes the x, y, z position of every body at time t into out, reading
+    the orbits from a StarSystem packed with the 'aosoa8' layout.
+
+    Parameters:
+    tiles (ndarray): a (tiles, fields, lanes) array from BodyTable.pack.
+    t (float): the time in days.
+    out (ndarray): an (n, 3) array receiving the positions.
+    """
+    n = out.shape[0]
+    lanes = tiles.shape[2]
+    for tile in numba.prange(tiles.shape[0]):
+        for lane in range(lanes):
+            i = tile * lanes + lane
+            if i < n:
+                out[i, 0], out[i, 1], out[i, 2] = _position(
+                    tiles[tile, 0, lane], tiles[tile, 1, lane],
+                    tiles[tile, 2, lane], tiles[tile, 3, lane], t)
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def kepler_solve(M: np.ndarray, ecc: np.ndarray, out: np.ndarray) -> None:
+    """
+    Solves Kepler's Equation (E - e * sin(E) = M) for every body, writing the
+    eccentric anomaly E into out.
+
+    Parameters:
+    M (ndarray): mean anomaly of each body in radians.
+    ecc (ndarray): eccentricity of each body.
+    out (ndarray): an array of the same length receiving E.
+    """
+    for i in numba.prange(M.shape[0]):
+        out[i] = _eccentric_anomaly(M[i], np.float64(ecc[i]))
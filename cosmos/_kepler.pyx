@@ -0,0 +1,90 @@
+# cython: language_level=3
+"""
+Cosmos Kepler Extension
+========================
+
+A C implementation of the propagation kernel in cosmos.propagate, for
+environments where JIT compilation is not wanted. Build it with
+`python setup.py build_ext --inplace`; cosmos.propagate uses it when present.
+"""
+
+from libc.math cimport atan, cos, sin, sqrt, tan, M_PI
+
+# Fixed number of Newton iterations on Kepler's equation.
+cdef int NEWTON_ITERATIONS = 5
+
+# One full orbit in radians.
+cdef double TAU = 2.0 * M_PI
+
+
+# Each input column may be float32 or float64 independently, as with the Numba
+# kernel; Cython compiles one specialisation per combination.
+ctypedef fused sma_t:
+    float
+    double
+
+ctypedef fused ecc_t:
+    float
+    double
+
+ctypedef fused incl_t:
+    float
+    double
+
+ctypedef fused period_t:
+    float
+    double
+
+
+cpdef void propagate(sma_t[::1] sma,
+                     ecc_t[::1] ecc,
+                     incl_t[::1] incl,
+                     period_t[::1] period,
+                     double t,
+                     double[:, ::1] out) noexcept nogil:
+    """
+    Writes the x, y, z position of every body at time t into out.
+
+    Parameters:
+    sma (ndarray): semi-major axis of each body.
+    ecc (ndarray): eccentricity of each body.
+    incl (ndarray): inclination of each body in degrees.
+    period (ndarray): orbital period of each body in days. Bodies with a period
+    of 0 do not orbit and are placed at the origin.
+    t (float): the time in days.
+    out (ndarray): an (n, 3) float64 array receiving the positions.
+
+    Each of sma, ecc, incl and period may be float32 or float64.
+    """
+    cdef Py_ssize_t i, n = sma.shape[0]
+    cdef int k
+    cdef double e, M, E, v, r, sv, inc
+
+    for i in range(n):
+        if period[i] == 0.0:
+            out[i, 0] = 0.0
+            out[i, 1] = 0.0
+            out[i, 2] = 0.0
+            continue
+
+        # Inputs may be float32; the solve itself stays in double.
+        e = ecc[i]
+
+        # Mean anomaly (M = n(t - T₀)), assuming T₀ = 0
+        M = TAU / period[i] * t
+
+        # Solve Kepler's Equation (E - e * sin(E) = M) with Newton's method.
+        E = M
+        for k in range(NEWTON_ITERATIONS):
+            E = E - (E - e * sin(E) - M) / (1.0 - e * cos(E))
+
+        # True anomaly (ν) and radial distance (r)
+        v = 2.0 * atan(sqrt((1.0 + e) / (1.0 - e)) * tan(E / 2.0))
+        r = sma[i] * (1.0 - e * cos(E))
+
+        # Rotate the orbital plane by the inclination about the line of nodes.
+        sv = sin(v)
+        inc = incl[i] * M_PI / 180.0
+        out[i, 0] = r * cos(v)
+        out[i, 1] = r * sv * cos(inc)
+        out[i, 2] = r * sv * sin(inc)
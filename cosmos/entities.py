@@ -8,7 +8,14 @@ modeling tool. The primary entities captured in this module include:
 
 - CelestialBody: Represents individual celestial objects such as stars,
     planets, moons, and comets. Each object carries general information,
-    orbital mechanics data, and physical properties.
+    orbital mechanics data, and physical properties. The make_star,
+    make_planet and make_moon factories build the common shapes of body.
+
+- BodyType: Enumerates the kinds of celestial body (star, planet, moon,
+    comet, asteroid).
+
+- BodyTable: Holds the numeric fields of many celestial bodies as parallel
+    arrays indexed by body id, for bulk simulation.
 
 - Constellation: Denotes a group of stars forming a recognizable pattern,
     traditionally named after its apparent form or identified with a
@@ -32,35 +39,25 @@ Each of the above entities is designed with modularity and extensibility in
 mind, making it easy to expand or adapt them to specific requirements or to
 integrate them into larger space simulation frameworks or tools.
 
-# THIS IS OUT OF DATE - REPLACE
-# Usage:
-# ------
-# To use any of the classes, create an instance and provide the required
-# parameters. For example, to create a new planet:
-
-# >>> earth_info = {
-# ...     'name': 'Earth',
-# ...     'description': 'A pale blue dot.',
-# ...     'body_type': 'planet',
-# ...     'parent': 'Sun'
-# ... }
-
-# >>> earth_mechanics = {
-# ...     'apogee': 1.0167,  # in AU, approximate aphelion distance
-# ...     'perigee': 0.9833,  # in AU, approximate perihelion distance
-# ...     'orbit_period': 365.25,  # in days
-# ...     'rotation_period': 0.997,  # in days, approximately 23.93 hours
-# ...     'inclination': 23.44  # axial tilt to its orbital plane
-# ... }
-
-# >>> earth_properties = {
-# ...     'radius': 6371,  # in km, approximate average radius
-# ...     'axial_tilt': 23.44  # in degrees
-# ... }
-
-# >>> earth = CelestialBody(general_info=earth_info,
-# ...                        orbital_parameters=earth_mechanics,
-# ...                        physical_properties=earth_properties)
+Usage:
+------
+To use any of the classes, create an instance and provide the required
+parameters. For example, to create a new planet:
+
+>>> earth = CelestialBody(
+...     name='Earth',
+...     description='A pale blue dot.',
+...     parent=sun,
+...     eccentricity=0.0167,
+...     semi_major_axis=149598262,  # in km
+...     inclination=7.155,  # in degrees
+...     orbital_period=365.256,  # in days
+...     mass=5.97237e24,  # in kg
+...     radius=6371,  # in km
+...     body_type=BodyType.PLANET,
+...     axial_tilt=23.44,  # in degrees
+...     rotation_period=0.997  # in days, approximately 23.93 hours
+... )
 
 For more complex entities like star systems or clusters, you might need to
 create multiple celestial bodies or systems first before aggregating them.
@@ -73,148 +70,479 @@ Notes:
     detailed simulation capabilities.
 """
 
-from typing import Dict, Tuple, List, Optional
+import math
+import uuid
+from dataclasses import dataclass, field
+from enum import IntEnum
+from operator import attrgetter
+from typing import Any, Optional, Sequence
+
+import numpy as np
 
 # View locations will be added and dropped from an active list to make
 # calculations faster. View locations will be merged so body positions will
 # only be computed once. This is for satellites mostly.
 
 
+# Shared stand-in for an empty collection, so containers built without
+# members and bodies without satellites do not each allocate a list.
+_EMPTY: tuple = ()
+
+# Bodies per tile in the 'aosoa8' layout.
+LANES = 8
+
+# Field names of the grouping dicts CelestialBody can report on demand.
+_GENERAL_INFO = ('name', 'description', 'parent', 'satellites')
+_ORBITAL_PARAMETERS = ('eccentricity', 'semi_major_axis', 'inclination',
+                       'orbital_period')
+_PHYSICAL_PROPERTIES = ('mass', 'radius', 'body_type', 'axial_tilt',
+                        'rotation_period')
+
+
+class BodyType(IntEnum):
+    """
+    The kinds of celestial body.
+    """
+
+    STAR = 0
+    PLANET = 1
+    MOON = 2
+    COMET = 3
+    ASTEROID = 4
+
+
+@dataclass(slots=True, eq=False, kw_only=True)
 class CelestialBody:
     """
     A class representing a celestial body within a star system.
-    """
 
-    def __init__(self,
-                 general_info: Dict,
-                 orbital_parameters: Dict,
-                 physical_properties: Dict) -> None:
-        """
-        Initialize a CelestialBody with general information, orbital mechanics,
-        and physical properties.
-        """
-        self.general_info = {
-            'name': general_info['name'],
-            'description': general_info['description'],
-            'parent': general_info['parent'],
-            'satellites': []
-        }
-
-        self.orbital_parameters = {
-            'eccentricity': orbital_parameters['eccentricity'],
-            'semi_major_axis': orbital_parameters["semi_major_axis"],
-            'inclination': orbital_parameters["inclination"],
-            'orbital_period': orbital_parameters["orbital_period"]
-        }
-
-        self.physical_properties = {
-            'mass': physical_properties['mass'],
-            'radius': physical_properties['radius'],
-            'body_type': physical_properties['body_type'],
-            'axial_tilt': physical_properties['axial_tilt'],
-            'rotation_period': physical_properties['rotation_period']
-        }
+    Fields are passed as keyword arguments and stored directly on slots. The
+    id is assigned when the body is added to a BodyTable and indexes its row
+    in that table. Equality and hashing use a separate identity fixed at
+    construction, which copies and unpickled bodies keep.
+    """
 
     # General Info
-    @property
-    def name(self) -> str:
+    name: str
+    description: str
+    parent: Optional['CelestialBody'] = field(repr=False)
+
+    # Orbital Parameters
+    eccentricity: float
+    semi_major_axis: float
+    inclination: float
+    orbital_period: float
+
+    # Physical Properties
+    mass: float
+    radius: float
+    body_type: BodyType
+    axial_tilt: float
+    rotation_period: float
+
+    # A shared empty tuple until the star system links a satellite.
+    satellites: Sequence['CelestialBody'] = field(default=_EMPTY, repr=False)
+    id: int = -1
+    # A random 128-bit identity, unique across processes so that bodies
+    # loaded from pickles made elsewhere do not collide.
+    _id: int = field(default_factory=lambda: uuid.uuid4().int, init=False,
+                     repr=False)
+    # The name of the parent body, as it was at construction.
+    parent_name: Optional[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        parent = self.parent
+        self.parent_name = parent.name if parent is not None else None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CelestialBody):
+            return NotImplemented
+        return self._id == other._id
+
+    def __hash__(self) -> int:
+        return self._id
+
+    @classmethod
+    def from_dicts(cls,
+                   general_info: dict,
+                   orbital_parameters: dict,
+                   physical_properties: dict) -> 'CelestialBody':
         """
-        Return the celestial body's name.
+        Create a CelestialBody from general information, orbital mechanics,
+        and physical properties dictionaries. The body type may be given as a
+        BodyType or by name, e.g. 'planet'. Any 'satellites' entry is ignored;
+        satellites are linked by the star system.
+
+        Raises:
+        - TypeError: If a dictionary is missing a field or has an unknown one.
+        - ValueError: If the body type name is not a BodyType.
         """
-        return self.general_info['name']
+        fields = {**general_info, **orbital_parameters, **physical_properties}
+        fields.pop('satellites', None)
+
+        body_type = fields.get('body_type')
+        if isinstance(body_type, str):
+            try:
+                fields['body_type'] = BodyType[body_type.upper()]
+            except KeyError:
+                raise ValueError(
+                    f"'{body_type}' is not a valid body_type") from None
+
+        return cls(**fields)
 
     @property
-    def description(self) -> str:
+    def general_info(self) -> dict:
         """
-        Return the celestial body's description.
+        Return the general information of the celestial body as a new dict.
         """
-        return self.general_info['description']
+        return {name: getattr(self, name) for name in _GENERAL_INFO}
 
     @property
-    def parent(self) -> 'CelestialBody':
+    def orbital_parameters(self) -> dict:
         """
-        Return the name of the parent body.
+        Return the orbital parameters of the celestial body as a new dict.
         """
-        return self.general_info['parent']
+        return {name: getattr(self, name) for name in _ORBITAL_PARAMETERS}
 
     @property
-    def satellites(self) -> List['CelestialBody']:
+    def physical_properties(self) -> dict:
         """
-        Return a list of satellites (if any).
+        Return the physical properties of the celestial body as a new dict.
         """
-        return self.general_info['satellites']
+        return {name: getattr(self, name) for name in _PHYSICAL_PROPERTIES}
 
-    # Orbital Paramters
-    @property
-    def eccentricity(self) -> float:
+
+def make_star(*,
+              name: str,
+              description: str,
+              mass: float,
+              radius: float,
+              axial_tilt: float,
+              rotation_period: float) -> CelestialBody:
+    """
+    Create a star at the center of its system: it has no parent and does not
+    orbit.
+    """
+    return CelestialBody(name=name,
+                         description=description,
+                         parent=None,
+                         eccentricity=0.0,
+                         semi_major_axis=0.0,
+                         inclination=0.0,
+                         orbital_period=0.0,
+                         mass=mass,
+                         radius=radius,
+                         body_type=BodyType.STAR,
+                         axial_tilt=axial_tilt,
+                         rotation_period=rotation_period)
+
+
+def _make_satellite(parent: CelestialBody,
+                    body_type: BodyType,
+                    *,
+                    name: str,
+                    description: str,
+                    eccentricity: float,
+                    semi_major_axis: float,
+                    inclination: float,
+                    orbital_period: float,
+                    mass: float,
+                    radius: float,
+                    axial_tilt: float,
+                    rotation_period: float) -> CelestialBody:
+    """
+    Create a body of the given type orbiting the given parent.
+    """
+    return CelestialBody(name=name,
+                         description=description,
+                         parent=parent,
+                         eccentricity=eccentricity,
+                         semi_major_axis=semi_major_axis,
+                         inclination=inclination,
+                         orbital_period=orbital_period,
+                         mass=mass,
+                         radius=radius,
+                         body_type=body_type,
+                         axial_tilt=axial_tilt,
+                         rotation_period=rotation_period)
+
+
+def make_planet(parent: CelestialBody, **orbit_and_physical) -> CelestialBody:
+    """
+    Create a planet orbiting the given parent, usually a star. Takes the same
+    keyword arguments as make_moon.
+    """
+    return _make_satellite(parent, BodyType.PLANET, **orbit_and_physical)
+
+
+def make_moon(parent: CelestialBody, **orbit_and_physical) -> CelestialBody:
+    """
+    Create a moon orbiting the given parent, usually a planet. Takes the same
+    keyword arguments as make_planet.
+    """
+    return _make_satellite(parent, BodyType.MOON, **orbit_and_physical)
+
+
+class BodyTable:
+    """
+    A structure-of-arrays companion to a collection of CelestialBody objects.
+    Each numeric field is held in a contiguous array indexed by body id, so
+    orbital math can run over whole columns instead of object graphs.
+
+    Mass, semi-major axis and orbital period need float64 precision; the
+    remaining fields are stored as float32 to halve their bandwidth.
+    """
+
+    __slots__ = ('_size', '_columns', '_derived')
+
+    # Columns copied from the CelestialBody attribute of the same name.
+    FIELDS = {
+        'mass': np.float64,
+        'radius': np.float32,
+        'eccentricity': np.float32,
+        'semi_major_axis': np.float64,
+        'inclination': np.float32,
+        'orbital_period': np.float64,
+        'axial_tilt': np.float32,
+        'rotation_period': np.float32,
+        'body_type': np.int8
+    }
+
+    # The id of each body's parent, or -1 for a body without one.
+    COLUMNS = {**FIELDS, 'parent_id': np.int32}
+
+    # Fields packed together, in order, by pack().
+    PACKED_FIELDS = ('semi_major_axis', 'eccentricity', 'inclination',
+                     'orbital_period')
+
+    # Fields preview() accepts. Their values within a star system span few
+    # enough orders of magnitude for float16. Masses and semi-major axes do
+    # not (a star is about 1e14 times heavier than a small moon, and moons
+    # orbit far closer than planets), and body types are not scaled.
+    PREVIEW_FIELDS = ('radius', 'eccentricity', 'inclination',
+                      'orbital_period', 'axial_tilt', 'rotation_period')
+
+    def __init__(self, capacity: int = 0) -> None:
         """
-        Return the eccentricity of the celestial body.
+        Constructs an empty table.
+
+        Parameters:
+        capacity (int): the number of rows to preallocate. The table grows as
+        needed. Default is 0.
         """
-        return self.orbital_parameters['eccentricity']
+        self._size = 0
+        self._columns = {name: np.empty(capacity, dtype=dtype)
+                         for name, dtype in self.COLUMNS.items()}
+        self._derived = {}
 
-    @property
-    def perigee(self) -> float:
+    @classmethod
+    def from_bodies(cls,
+                    bodies: list[CelestialBody],
+                    parent_ids: list[int]) -> 'BodyTable':
         """
-        Return the perigee of the celestial body.
+        Builds a table with one row per body, in order, filling each column
+        in a single pass. Each body's id is set to its row.
+
+        Parameters:
+        bodies (list): the bodies to add.
+        parent_ids (list): the id of each body's parent in the table, or -1 if
+        it has none.
         """
-        return self.orbital_parameters['perigee']
+        size = len(bodies)
+        columns = {name: np.fromiter(map(attrgetter(name), bodies),
+                                     dtype=dtype, count=size)
+                   for name, dtype in cls.FIELDS.items()}
+        for row, body in enumerate(bodies):
+            body.id = row
+        return cls.from_columns(columns, parent_ids)
 
-    @property
-    def semi_major_axis(self) -> float:
+    @classmethod
+    def from_columns(cls,
+                     columns: dict[str, np.ndarray],
+                     parent_ids: np.ndarray) -> 'BodyTable':
         """
-        Return the semi major axis of the celestial body.
+        Builds a table directly from one array per field. Arrays that are
+        already contiguous and of the column's dtype are used without a copy.
+
+        Parameters:
+        columns (dict): maps each name in FIELDS to an array of values.
+        parent_ids (ndarray): the id of each body's parent in the table, or -1
+        if it has none.
         """
-        return self.orbital_parameters['semi_major_axis']
+        table = cls()
+        table._size = len(parent_ids)
+        for name, dtype in cls.FIELDS.items():
+            table._columns[name] = np.ascontiguousarray(columns[name],
+                                                        dtype=dtype)
+        table._columns['parent_id'] = np.ascontiguousarray(parent_ids,
+                                                           dtype=np.int32)
+        return table
 
-    @property
-    def inclination(self) -> float:
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.column(name)
+
+    def _grow(self) -> None:
         """
-        Return the inclination of the celestial body.
+        Doubles the capacity of every column.
         """
-        return self.orbital_parameters['inclination']
+        capacity = max(8, 2 * self._size)
+        for name, column in self._columns.items():
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
 
-    @property
-    def orbital_period(self) -> float:
+    def add(self, body: CelestialBody, parent_id: int = -1) -> int:
         """
-        Return the orbital period of the celestial body.
+        Pushes a row for the body into the table and assigns its id.
+
+        Parameters:
+        body (CelestialBody): the body to add.
+        parent_id (int): the id of the body's parent in this table, or -1 if
+        it has none. Default is -1.
+
+        Returns:
+        int: the id of the new row.
         """
-        return self.orbital_parameters['orbital_period']
+        row = self._size
+        columns = self._columns
+        if row == len(columns['mass']):
+            self._grow()
+        for name in self.FIELDS:
+            columns[name][row] = getattr(body, name)
+        columns['parent_id'][row] = parent_id
+        body.id = row
+        self._size += 1
+        self.invalidate()
+        return row
 
-    # Physical Properties
-    @property
-    def mass(self) -> float:
+    def column(self, name: str) -> np.ndarray:
         """
-        Return the mass of the celestial body.
+        Returns a view of the named numeric field for every body in the table.
+        table[name] is equivalent.
         """
-        return self.physical_properties['mass']
+        return self._columns[name][:self._size]
 
-    @property
-    def radius(self) -> float:
+    def invalidate(self) -> None:
         """
-        Return the radius of the celestial body.
+        Discards the cached derived quantities. Call this after modifying any
+        column in place.
         """
-        return self.physical_properties['radius']
+        self._derived.clear()
 
-    @property
-    def body_type(self) -> str:
+    def _cached(self, name: str, compute) -> Any:
         """
-        Return the type of celestial body (e.g. star, planet, moon).
+        Returns the derived quantity with the given name, computing it over
+        whole columns on first use.
         """
-        return self.physical_properties['body_type']
+        derived = self._derived.get(name)
+        if derived is None:
+            derived = self._derived[name] = compute()
+        return derived
 
-    @property
-    def axial_tilt(self) -> float:
+    def mean_motion(self) -> np.ndarray:
         """
-        Return the axial tilt of the celestial body.
+        Returns the mean motion of each body in radians per day, or 0 for
+        bodies that do not orbit.
         """
-        return self.physical_properties['axial_tilt']
+        def compute():
+            period = self.column('orbital_period')
+            return np.divide(math.tau, period, out=np.zeros_like(period),
+                             where=period != 0)
+        return self._cached('mean_motion', compute)
 
-    @property
-    def rotation_period(self) -> float:
+    def sin_inclination(self) -> np.ndarray:
+        """
+        Returns the sine of each body's inclination.
+        """
+        return self._cached('sin_inclination', lambda: np.sin(
+            np.radians(self.column('inclination'), dtype=np.float64)))
+
+    def cos_inclination(self) -> np.ndarray:
         """
-        Return the rotational period of the celestial body.
+        Returns the cosine of each body's inclination.
         """
-        return self.physical_properties['rotation_period']
+        return self._cached('cos_inclination', lambda: np.cos(
+            np.radians(self.column('inclination'), dtype=np.float64)))
+
+    def periapsis(self) -> np.ndarray:
+        """
+        Returns each body's closest distance to its parent, a(1 - e).
+        """
+        return self._cached('periapsis', lambda: (
+            self.column('semi_major_axis')
+            * (1.0 - self.column('eccentricity'))))
+
+    def apoapsis(self) -> np.ndarray:
+        """
+        Returns each body's furthest distance from its parent, a(1 + e).
+        """
+        return self._cached('apoapsis', lambda: (
+            self.column('semi_major_axis')
+            * (1.0 + self.column('eccentricity'))))
+
+    def preview(self, name: str) -> tuple[np.ndarray, float]:
+        """
+        Returns a float16 copy of the named column for bulk rendering and
+        culling, where about three significant digits are enough.
+
+        Values are divided by a power of two that brings the largest to
+        between 2**14 and 2**15, near the top of float16's range; the column
+        is approximately values * scale. Values more than about 5e8 times
+        smaller than the largest fall below float16's normal range and lose
+        precision, so only PREVIEW_FIELDS may be previewed.
+
+        Returns:
+        tuple: (values, scale)
+
+        Raises:
+        - ValueError: If name is not one of PREVIEW_FIELDS.
+        """
+        if name not in self.PREVIEW_FIELDS:
+            raise ValueError(f"'{name}' should be one of "
+                             f"{self.PREVIEW_FIELDS}")
+
+        def compute():
+            column = self.column(name)
+            peak = float(np.abs(column).max()) if len(column) else 0.0
+            scale = (2.0 ** (math.ceil(math.log2(peak)) - 15) if peak > 0
+                     else 1.0)
+            return (column / scale).astype(np.float16), scale
+        return self._cached(f'preview:{name}', compute)
+
+    def pack(self, layout: str) -> np.ndarray:
+        """
+        Returns a float64 copy of the PACKED_FIELDS of every body, with the
+        fields of each body kept close together:
+
+        - 'aos': an (n, fields) array with one row per body.
+        - 'aosoa8': a (ceil(n / 8), fields, 8) array of tiles of 8 bodies;
+          body i is at [i // 8, field, i % 8]. Unused lanes are zero.
+        """
+        size = self._size
+        if layout == 'aos':
+            packed = np.empty((size, len(self.PACKED_FIELDS)))
+            for field_id, name in enumerate(self.PACKED_FIELDS):
+                packed[:, field_id] = self.column(name)
+            return packed
+
+        if layout == 'aosoa8':
+            tiles = -(-size // LANES)
+            lanes = np.zeros((len(self.PACKED_FIELDS), tiles * LANES))
+            for field_id, name in enumerate(self.PACKED_FIELDS):
+                lanes[field_id, :size] = self.column(name)
+            packed = lanes.reshape(len(self.PACKED_FIELDS), tiles, LANES)
+            return np.ascontiguousarray(packed.transpose(1, 0, 2))
+
+        raise ValueError(f"'{layout}' is not a packed layout")
+
+    def of_type(self, body_type: BodyType) -> np.ndarray:
+        """
+        Returns the ids of every body of the given type.
+        """
+        return np.flatnonzero(self.column('body_type') == body_type)
 
 
 class Constellation:
@@ -222,10 +550,12 @@ class Constellation:
     A class to represent a constellation.
     """
 
+    __slots__ = ('_name', '_description', '_location')
+
     def __init__(self,
                  name: str,
                  description: str,
-                 location: Tuple[float]) -> None:
+                 location: tuple[float, ...]) -> None:
         """
         Constructs all the necessary attributes for the Constellation object.
 
@@ -243,33 +573,78 @@ class Constellation:
         """
         Returns the name of the constellation.
         """
-        return self.name
+        return self._name
 
     @property
     def description(self) -> str:
         """
         Returns the description of the constellation.
         """
-        return self.description
+        return self._description
 
     @property
-    def location(self) -> Tuple[float]:
+    def location(self) -> tuple[float, ...]:
         """
         Returns a x,y coordinate location of the constellation.
         """
-        return self.location
+        return self._location
+
+
+def _group_children(parent_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Groups bodies by parent into a compressed sparse row index, keeping
+    satellites in their original order. Returns (offsets, ids); the
+    satellites of body i are ids[offsets[i]:offsets[i + 1]].
+    """
+    size = len(parent_ids)
+    # Shift by one so bodies without a parent are counted in bin 0.
+    counts = np.bincount(parent_ids + 1, minlength=size + 1)
+    offsets = np.zeros(size + 1, dtype=np.int32)
+    np.cumsum(counts[1:], out=offsets[1:])
+    # A stable sort keeps satellites in the order they were given, and places
+    # every body without a parent ahead of the rest.
+    order = np.argsort(parent_ids, kind='stable')
+    return offsets, order[counts[0]:].astype(np.int32)
+
+
+def _pack_locations(owners: Sequence, components: int) -> np.ndarray:
+    """
+    Packs the locations of the given constellations or star systems into an
+    (n, components) float32 array, raising ValueError if any location has a
+    different number of components.
+    """
+    if not owners:
+        return np.empty((0, components), dtype=np.float32)
+    for owner in owners:
+        if len(owner.location) != components:
+            raise ValueError(f"'{owner.name}' should have a location with "
+                             f"{components} components")
+    return np.array([owner.location for owner in owners], dtype=np.float32)
+
+
+try:
+    from cosmos._entities import group_children
+except ImportError:  # The C extension has not been built.
+    group_children = _group_children
 
 
 class StarSystem:
     """
     A class to represent a star system. Only objects that orbit the star system
-    barycenter should be included.
+    barycenter should be included. The bodies are indexed when the system is
+    built, so the system should be treated as fixed afterwards.
     """
 
+    __slots__ = ('_name', '_location', '_bodies', '_table', '_by_name',
+                 '_children_offsets', '_children_ids', '_layout', '_packed')
+
+    LAYOUTS = ('soa', 'aos', 'aosoa8')
+
     def __init__(self,
                  name: str,
-                 location: Tuple[float],
-                 bodies: Optional[List[CelestialBody]] = None) -> None:
+                 location: tuple[float, ...],
+                 bodies: Optional[list[CelestialBody]] = None,
+                 layout: str = 'soa') -> None:
         """
         Constructs all the necessary attributes for the StarSystem object.
 
@@ -278,43 +653,245 @@ class StarSystem:
         location (tuple): a list mapping star system x, y, z coordinates
         bodies (list): a list of celestial bodies orbiting this barycenter.
         Default is None.
+        layout (str): 'soa' to keep orbits only in the BodyTable columns, or
+        'aos'/'aosoa8' to also pack them for kernels that read several fields
+        per body (see BodyTable.pack). Default is 'soa'.
         """
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"'layout' should be one of {self.LAYOUTS}")
+
         self._name = name
         self._location = location
-        self._bodies = bodies or []
+        self._bodies = bodies if bodies is not None else _EMPTY
+        self._layout = layout
 
+        self._by_name = {}
+        self._index_bodies()
+        self._link()
+
+    @classmethod
+    def from_arrow(cls,
+                   name: str,
+                   location: tuple[float, ...],
+                   table,
+                   layout: str = 'soa') -> 'StarSystem':
+        """
+        Constructs a StarSystem from a columnar catalog, moving the numeric
+        columns straight into the BodyTable.
+
+        Parameters:
+        name (str): the name of the star system
+        location (tuple): a list mapping star system x, y, z coordinates
+        table (pyarrow.Table): one row per body, with a column for each
+        CelestialBody field. 'parent' holds the name of the parent body, or
+        null; 'body_type' holds BodyType values or names.
+        layout (str): see StarSystem. Default is 'soa'.
+
+        Raises:
+        - ValueError: If the layout is unknown, a parent name is not the name
+                      of a body in the table, or a body type name is not a
+                      BodyType.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if layout not in cls.LAYOUTS:
+            raise ValueError(f"'layout' should be one of {cls.LAYOUTS}")
+
+        def decoded(column):
+            # Parquet and Polars often give dictionary-encoded or large_string
+            # columns, and an all-null column has the null type; all of them
+            # are compared as plain strings.
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            if (pa.types.is_large_string(column.type)
+                    or pa.types.is_null(column.type)):
+                column = column.cast(pa.string())
+            return column
+
+        names = decoded(table.column('name'))
+        parents = decoded(table.column('parent'))
+        parent_ids = pc.index_in(parents, value_set=names)
+        unresolved = pc.and_(pc.is_null(parent_ids), pc.is_valid(parents))
+        if pc.any(unresolved).as_py():
+            missing = pc.filter(parents, unresolved)[0].as_py()
+            raise ValueError(f"parent '{missing}' is not a body in the table")
+        parent_ids = parent_ids.fill_null(-1).to_numpy()
+
+        columns = {field_name: table.column(field_name).to_numpy()
+                   for field_name in BodyTable.FIELDS
+                   if field_name != 'body_type'}
+        body_types = decoded(table.column('body_type'))
+        if pa.types.is_string(body_types.type):
+            # Members are numbered in order from 0, so a name's position in
+            # the member list is its value.
+            body_types = pc.index_in(
+                pc.utf8_upper(body_types),
+                value_set=pa.array(list(BodyType.__members__)))
+            if body_types.null_count:
+                raise ValueError("'body_type' should be a BodyType or the "
+                                 "name of one")
+        columns['body_type'] = body_types.to_numpy()
+        body_table = BodyTable.from_columns(columns, parent_ids)
+
+        # The objects are built from plain lists; parents are linked after
+        # every body exists, so the catalog may list them in any order.
+        values = {field_name: column.tolist()
+                  for field_name, column in columns.items()}
+        values['body_type'] = map(BodyType, values['body_type'])
+        bodies = [CelestialBody(name=body_name,
+                                description=description,
+                                parent=None,
+                                **dict(zip(values, fields)))
+                  for body_name, description, *fields in zip(
+                      names.to_pylist(),
+                      decoded(table.column('description')).to_pylist(),
+                      *values.values())]
+        for row, (body, parent_id) in enumerate(zip(bodies,
+                                                    parent_ids.tolist())):
+            body.id = row
+            if parent_id >= 0:
+                body.parent = bodies[parent_id]
+                body.parent_name = bodies[parent_id].name
+
+        system = cls.__new__(cls)
+        system._name = name
+        system._location = location
+        system._bodies = bodies
+        system._layout = layout
+        system._by_name = {body.name: body for body in bodies}
+        system._table = body_table
+        system._link()
+        return system
+
+    def _link(self) -> None:
+        """
+        Builds the children index, satellite lists and any packed layout from
+        the star system's table.
+        """
+        self._generate_children_index()
         self._generate_satellite_list()
 
+        self._packed = (None if self._layout == 'soa'
+                        else self._table.pack(self._layout))
+
+    def _index_bodies(self) -> None:
+        """
+        Resolves every body's parent and fills the name index in a single
+        pass, then builds the table from the bodies in bulk. Parents listed
+        after their satellites are resolved in a second pass over just those
+        satellites.
+        """
+        ids = {}
+        parent_ids = []
+        forward = []
+        for row, body in enumerate(self._bodies):
+            parent = body.parent
+            parent_ids.append(ids.get(parent, -1))
+            ids[body] = row
+            self._by_name[body.name] = body
+            if parent is not None and parent not in ids:
+                forward.append(row)
+
+        for row in forward:
+            parent_ids[row] = ids.get(self._bodies[row].parent, -1)
+
+        self._table = BodyTable.from_bodies(self._bodies, parent_ids)
+
+    def _generate_children_index(self) -> None:
+        """
+        Groups the table's parent ids into a compressed sparse row index: the
+        ids of the satellites of body i are
+        children_ids[children_offsets[i]:children_offsets[i + 1]].
+        """
+        self._children_offsets, self._children_ids = group_children(
+            self._table.column('parent_id'))
+
     def _generate_satellite_list(self) -> None:
         """
-        Updates the satellites list for each celestial body based on the parent
-        attribute of other celestial bodies in the system.
+        Updates the satellites list for each celestial body from the children
+        index.
+        """
+        bodies = self._bodies
+        offsets = self._children_offsets.tolist()
+        children = self._children_ids.tolist()
+        for body, start, stop in zip(bodies, offsets, offsets[1:]):
+            if start == stop:
+                continue
+            if body.satellites is _EMPTY:
+                body.satellites = []
+            body.satellites.extend(bodies[i] for i in children[start:stop])
+
+    def children_of(self, body_id: int) -> np.ndarray:
+        """
+        Returns the ids of the satellites of the body with the given id.
+        """
+        offsets = self._children_offsets
+        return self._children_ids[offsets[body_id]:offsets[body_id + 1]]
+
+    def children_of_type(self,
+                         body_id: int,
+                         body_type: BodyType) -> np.ndarray:
+        """
+        Returns the ids of the satellites of the body with the given id that
+        are of the given type.
+        """
+        children = self.children_of(body_id)
+        body_types = self._table.column('body_type')
+        return children[body_types[children] == body_type]
+
+    def find(self, name: str) -> CelestialBody:
+        """
+        Returns the celestial body with the given name.
+
+        Raises:
+        - KeyError: If no body in the star system has that name.
         """
-        for body in self._bodies:
-            for potential_satellite in self._bodies:
-                if potential_satellite.parent == body.name:
-                    body.satellites.append(potential_satellite)
+        return self._by_name[name]
 
     @property
     def name(self) -> str:
         """
         Returns the name of the star system.
         """
-        return self.name
+        return self._name
 
     @property
     def location(self) -> tuple:
         """
         Returns a x,y,z coordinate location of the star system.
         """
-        return self.location
+        return self._location
 
     @property
-    def bodies(self) -> List[CelestialBody]:
+    def bodies(self) -> Sequence[CelestialBody]:
         """
         Returns the a list of CelestialBody objects in the star system.
         """
-        return self.bodies
+        return self._bodies
+
+    @property
+    def layout(self) -> str:
+        """
+        Returns the memory layout the star system was built with.
+        """
+        return self._layout
+
+    @property
+    def packed(self) -> Optional[np.ndarray]:
+        """
+        Returns the orbits packed in the star system's layout, or None for
+        the 'soa' layout.
+        """
+        return self._packed
+
+    @property
+    def table(self) -> BodyTable:
+        """
+        Returns the BodyTable holding the numeric fields of the star system's
+        bodies.
+        """
+        return self._table
 
 
 class Skybox:
@@ -322,9 +899,11 @@ class Skybox:
     A class to represent the skybox as a sphere surrounding the star scape.
     """
 
+    __slots__ = ('_radius', '_constellations', '_constellation_locations')
+
     def __init__(self,
                  radius: int,
-                 constellations: List[Constellation] | None = None) -> None:
+                 constellations: list[Constellation] | None = None) -> None:
         """
         Constructs all the necessary attributes for the Skybox object.
 
@@ -332,23 +911,38 @@ class Skybox:
         radius (float): the radius of the sphere in lightyears.
         constellations (dict): a dictionary mapping star names to Constellation
         Objects. Default is an empty dict.
+
+        Raises:
+        - ValueError: If a constellation's location does not have 2
+                      components.
         """
         self._radius = radius
-        self._constellations = constellations or []
+        self._constellations = (constellations if constellations is not None
+                                else _EMPTY)
+        self._constellation_locations = _pack_locations(self._constellations,
+                                                        2)
 
     @property
-    def radius(self) -> str:
+    def radius(self) -> int:
         """
         Returns the radius of the skybox in lightyears.
         """
-        return self.radius
+        return self._radius
 
     @property
-    def constellations(self) -> List[Constellation]:
+    def constellations(self) -> Sequence[Constellation]:
         """
         Returns a list of Constellation objects in the skybox
         """
-        return self.constellations
+        return self._constellations
+
+    @property
+    def constellation_locations(self) -> np.ndarray:
+        """
+        Returns an (n, 2) array of the constellations' coordinates, in the
+        same order as constellations.
+        """
+        return self._constellation_locations
 
 
 class StarCluster:
@@ -358,22 +952,66 @@ class StarCluster:
     capture the idea of a community of star systems.
     """
 
+    __slots__ = ('_name', 'skybox', '_star_systems', '_system_locations')
+
     def __init__(self,
                  name: str,
                  skybox: Skybox,
-                 star_systems: Optional[List[StarSystem]] = None) -> None:
+                 star_systems: Optional[list[StarSystem]] = None) -> None:
         """
         Constructs all the necessary attributes for the StarCluster object.
 
         Parameters:
         name (str): the name of the star_cluster object
         skybox (Skybox): The surrounding skybox.
-        star_systems (List[StarSystem]): a list of star_system objects. Default
+        star_systems (list[StarSystem]): a list of star_system objects. Default
         is None.
+
+        Raises:
+        - ValueError: If a star system's location does not have 3
+                      components.
         """
         self._name = name
         self.skybox = skybox
-        self._star_systems = star_systems or []
+        self._star_systems = (star_systems if star_systems is not None
+                              else _EMPTY)
+        self._system_locations = _pack_locations(self._star_systems, 3)
+
+    def nearest(self,
+                location: tuple[float, ...],
+                count: int = 1) -> list[StarSystem]:
+        """
+        Returns up to count star systems closest to a location, nearest first.
+
+        Parameters:
+        location (tuple): the x, y, z coordinates to measure from.
+        count (int): the number of star systems to return. Default is 1.
+        """
+        distances = np.linalg.norm(
+            self._system_locations - np.asarray(location, dtype=np.float32),
+            axis=1)
+        count = min(count, len(distances))
+        if count <= 0:
+            return []
+        nearest = np.argpartition(distances, count - 1)[:count]
+        nearest = nearest[np.argsort(distances[nearest])]
+        return [self._star_systems[i] for i in nearest]
+
+    def find(self, name: str) -> CelestialBody:
+        """
+        Returns the celestial body with the given name from the first star
+        system that contains it.
+
+        Raises:
+        - KeyError: If no star system in the cluster has a body with that
+                    name.
+        """
+        for star_system in self._star_systems:
+            try:
+                return star_system.find(name)
+            except KeyError:
+                pass
+        raise KeyError(name)
 
     @property
     def name(self) -> str:
@@ -383,8 +1021,16 @@ class StarCluster:
         return self._name
 
     @property
-    def star_systems(self) -> List[StarSystem]:
+    def star_systems(self) -> Sequence[StarSystem]:
         """
         Returns the StarSystems within the StarCluster.
         """
         return self._star_systems
+
+    @property
+    def system_locations(self) -> np.ndarray:
+        """
+        Returns an (n, 3) array of the star systems' coordinates, in the same
+        order as star_systems.
+        """
+        return self._system_locations
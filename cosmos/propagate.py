@@ -0,0 +1,104 @@
+"""
+Cosmos Propagation
+===================
+
+Compiled kernels for computing the positions of many celestial bodies at
+once. Kernels operate on the contiguous columns of a BodyTable rather than on
+CelestialBody objects, so no Python objects are touched inside the loop.
+
+propagate() is the C extension in cosmos._kepler when it has been built (see
+setup.py), and the Numba kernel propagate_jit() otherwise. Numba is only
+imported when a JIT kernel is used, so it is not needed once the extension is
+built. positions_cuda() computes a whole ephemeris on a CUDA device, where one
+is available.
+
+Positions are relative to each body's parent, in the same units as the
+semi-major axis. Inclination is given in degrees and orbital period in days.
+"""
+
+import numpy as np
+
+from cosmos.entities import BodyTable
+
+# Kernels and constants in cosmos._jit, imported from there when first used.
+_JIT_NAMES = ('propagate_jit', 'propagate_tiles', 'kepler_solve',
+              'NEWTON_ITERATIONS', 'TAU')
+
+try:
+    from cosmos._kepler import propagate
+except ImportError:  # The C extension has not been built.
+    from cosmos._jit import propagate_jit as propagate
+
+
+def __getattr__(name: str):
+    """
+    Returns the Numba kernels and constants from cosmos._jit on access, so that
+    importing this module does not import Numba.
+    """
+    if name in _JIT_NAMES:
+        from cosmos import _jit
+        return getattr(_jit, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def positions(table: BodyTable, t: float) -> np.ndarray:
+    """
+    Returns an (n, 3) array of the positions of every body in the table at
+    time t.
+    """
+    out = np.empty((len(table), 3), dtype=np.float64)
+    propagate(table.column('semi_major_axis'),
+              table.column('eccentricity'),
+              table.column('inclination'),
+              table.column('orbital_period'),
+              t,
+              out)
+    return out
+
+
+def eccentric_anomalies(table: BodyTable, t: float) -> np.ndarray:
+    """
+    Returns the eccentric anomaly of every body in the table at time t, using
+    the table's cached mean motion.
+    """
+    from cosmos._jit import kepler_solve
+
+    out = np.empty(len(table), dtype=np.float64)
+    kepler_solve(table.mean_motion() * t, table.column('eccentricity'), out)
+    return out
+
+
+def positions_cuda(table: BodyTable, times: np.ndarray) -> np.ndarray:
+    """
+    Returns a (len(times), n, 3) array of the positions of every body in the
+    table at every time, computed on a CUDA device. The times are copied in
+    from pinned memory on a single stream.
+
+    Raises:
+    - RuntimeError: If no CUDA device is available.
+    """
+    from numba import cuda
+
+    from cosmos._cuda import CUDA_THREADS, propagate_cuda
+
+    if not cuda.is_available():
+        raise RuntimeError("positions_cuda needs a CUDA device")
+
+    stream = cuda.stream()
+    pinned = cuda.pinned_array(len(times), dtype=np.float64)
+    pinned[:] = times
+    sma, ecc, incl, period = (
+        cuda.to_device(table.column(name), stream=stream)
+        for name in ('semi_major_axis', 'eccentricity', 'inclination',
+                     'orbital_period'))
+    d_times = cuda.to_device(pinned, stream=stream)
+    d_out = cuda.device_array((len(times), len(table), 3), dtype=np.float64,
+                              stream=stream)
+
+    blocks = (len(times) * len(table) + CUDA_THREADS - 1) // CUDA_THREADS
+    if blocks:
+        propagate_cuda[blocks, CUDA_THREADS, stream](
+            sma, ecc, incl, period, d_times, d_out)
+    out = d_out.copy_to_host(stream=stream)
+    stream.synchronize()
+    return out
@@ -1,6 +1,99 @@
 import math
+import sys
+
+import matplotlib
+
+# Run with --headless (e.g. when benchmarking) to skip the GUI backend and its start-up cost
+HEADLESS = "--headless" in sys.argv
+if HEADLESS:
+    matplotlib.use("Agg")
+
+# Run with --check to verify the solver against known positions before plotting
+CHECK = "--check" in sys.argv
+
 import matplotlib.pyplot as plt
-from typing import Dict
+import numpy as np
+from numba import njit, prange
+from typing import Dict, Optional
+
+
+@njit(cache=True, fastmath=True)
+def _solve_danby(M: float, e: float):
+    # Solving Kepler's Equation (E - e * sin(E) = M) iteratively using Danby's quartic method.
+    # Starting from the third-order series in e, E = M + e sinM + (e²/2) sin2M + (e³/8)(3 sin3M - sinM),
+    # using sin 2M = 2 sinM cosM and sin 3M = sinM (3 - 4 sin²M) so that it costs one sin/cos pair
+    sinM, cosM = math.sin(M), math.cos(M)
+    sin2M = 2 * sinM * cosM
+    sin3M = sinM * (3 - 4 * sinM * sinM)
+    E = M + e * sinM + (e * e / 2) * sin2M + (e * e * e / 8) * (3 * sin3M - sinM)
+    for _ in range(5):  # quartic convergence, usually 2-3 iterations
+        s, c = math.sin(E), math.cos(E)
+        f = E - e * s - M
+        if abs(f) < 1e-12:
+            break
+        fp = 1 - e * c
+        fpp = e * s
+        fppp = e * c
+        d1 = -f / fp
+        d2 = -f / (fp + 0.5 * d1 * fpp)
+        d3 = -f / (fp + 0.5 * d2 * fpp + d2 * d2 * fppp / 6)
+        E += d3
+
+    return E
+
+
+@njit(cache=True, fastmath=True)
+def _kepler_xyz(t: float, e: float, a: float, n: float, nu_factor: float, sin_inc: float, cos_inc: float):
+    # n, nu_factor, sin_inc and cos_inc are per-body invariants precomputed by CelestialBody
+
+    # Mean anomaly (M = n(t - T₀))
+    M = n * t  # Assuming T₀ = 0 for simplicity
+
+    # Circular orbit: E = ν = M, r = a
+    if e == 0:
+        sv = a * math.sin(M)
+        return a * math.cos(M), sv * cos_inc, sv * sin_inc
+
+    if e < 0.3:
+        # Near-circular orbit: Meeus's closed-form estimate plus two Newton corrections
+        # (atan2 only covers one revolution, so M is first reduced to [-π, π] and the estimate is then moved
+        # onto M's branch; at M = ±π the rounding of sin M can put atan2 on the opposite side)
+        M -= 2 * math.pi * np.rint(M / (2 * math.pi))
+        E = math.atan2(math.sin(M), math.cos(M) - e)
+        E += 2 * math.pi * np.rint((M - E) / (2 * math.pi))
+        for _ in range(2):  # One step alone leaves errors of up to ~1e-6 near e = 0.3
+            sE, cE = math.sin(E), math.cos(E)
+            E -= (E - e * sE - M) / (1 - e * cE)
+    else:
+        E = _solve_danby(M, e)
+
+    # One sin/cos pair of the solved E serves both ν and r
+    sE, cE = math.sin(E), math.cos(E)
+
+    # True anomaly (ν), with tan(E/2) = sin E / (1 + cos E), or (1 - cos E) / sin E near E = π where 1 + cos E cancels
+    tan_half = sE / (1 + cE) if cE > -0.9999 else (1 - cE) / sE
+    v = 2 * math.atan(nu_factor * tan_half)
+
+    # Radial distance (r)
+    r = a * (1 - e * cE)
+
+    # Using r and ν to get (x, y, z)
+    # Rotating the orbital plane by the inclination about the line of nodes (the x axis)
+    sv, cv = math.sin(v), math.cos(v)
+    x = r * cv
+    y = r * sv * cos_inc
+    z = r * sv * sin_inc
+
+    return x, y, z
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _kepler_xyz_array(ts: np.ndarray, e: float, a: float, n: float, nu_factor: float, sin_inc: float,
+                      cos_inc: float, out: np.ndarray):
+    # _kepler_xyz over an array of times, split across all cores; writes x, y, z into the rows of out
+    for i in prange(ts.shape[0]):
+        out[0, i], out[1, i], out[2, i] = _kepler_xyz(ts[i], e, a, n, nu_factor, sin_inc, cos_inc)
+
 
 class CelestialBody:
     def __init__(self, name: str, mass: float, orbital_parameters: Dict[str, float]):
@@ -11,43 +104,62 @@ class CelestialBody:
         self.inclination = orbital_parameters["inclination"]
         self.orbit_period = orbital_parameters["orbit_period"]
 
-    def position_at_time(self, t: float):
-        # Mean motion (n = 2π/T)
-        n = 2 * math.pi / self.orbit_period
-
-        # Mean anomaly (M = n(t - T₀))
-        M = n * t  # Assuming T₀ = 0 for simplicity
+        # Invariants of the orbit, computed once rather than on every position
+        self._n = 2 * math.pi / self.orbit_period  # Mean motion (n = 2π/T)
+        self._nu_factor = math.sqrt((1 + self.eccentricity) / (1 - self.eccentricity)) if self.eccentricity < 1 else math.inf
+        self._sin_inc = math.sin(math.radians(self.inclination))  # Inclination is given in degrees
+        self._cos_inc = math.cos(math.radians(self.inclination))
 
-        # Solving Kepler's Equation (E - e * sin(E) = M) iteratively using Newton's method.
-        # Starting with an initial guess of E = M
-        E = M
-        for _ in range(10):  # usually converges quickly
-            E = E - (E - self.eccentricity * math.sin(E) - M) / (1 - self.eccentricity * math.cos(E))
-
-        # True anomaly (ν)
-        v = 2 * math.atan(math.sqrt((1 + self.eccentricity) / (1 - self.eccentricity)) * math.tan(E / 2))
-
-        # Radial distance (r)
-        r = self.semi_major_axis * (1 - self.eccentricity * math.cos(E))
+    def position_at_time(self, t: float):
+        return _kepler_xyz(t, self.eccentricity, self.semi_major_axis, self._n, self._nu_factor, self._sin_inc, self._cos_inc)
 
-        # Using r and ν to get (x, y, z)
-        x = r * (math.cos(v))
-        y = r * (math.sin(v))
-        z = r * (math.sin(v) * math.sin(self.inclination))
+    def positions_at_times(self, t: np.ndarray, out: Optional[np.ndarray] = None):
+        # Same solve as position_at_time, over a whole array of times at once.
+        # Writes x, y, z into the rows of out, a (3, len(t)) array, allocating it if not given.
+        t = np.asarray(t, dtype=np.float64)
+        if t.ndim != 1:
+            raise ValueError("t should be a 1-D array of times")
+        if out is None:
+            out = np.empty((3, len(t)))
+        # The kernel writes without bounds checks, so out must match exactly
+        elif out.shape != (3, len(t)) or out.dtype != np.float64 or not out.flags.writeable:
+            raise ValueError(f"out should be a writeable float64 array of shape (3, {len(t)})")
+        _kepler_xyz_array(t, self.eccentricity, self.semi_major_axis, self._n, self._nu_factor, self._sin_inc,
+                          self._cos_inc, out)
 
-        return x, y, z
+        return out
 
 
 class StarSystem:
+    # Number of distinct time arrays whose positions sample() keeps
+    MAX_SAMPLES = 8
+
     def __init__(self, primary: CelestialBody, secondary: CelestialBody):
         self.primary = primary
         self.secondary = secondary
+        self._samples = {}
 
     def get_positions(self, t: float):
-        x1, y1, z1 = self.primary.position_at_time(t)
-        x2, y2, z2 = self.secondary.position_at_time(t)
+        return self.primary.position_at_time(t), self.secondary.position_at_time(t)
+
+    def get_positions_at_times(self, t: np.ndarray):
+        return self.primary.positions_at_times(t), self.secondary.positions_at_times(t)
+
+    def sample(self, times: np.ndarray):
+        # get_positions_at_times, cached by the contents of times so that redraws over the same times reuse
+        # the positions. The cached arrays are shared between callers and so are made read-only.
+        key = (times.dtype.str, times.tobytes())
+        samples = self._samples.get(key)
+        if samples is None:
+            if len(self._samples) >= self.MAX_SAMPLES:
+                del self._samples[next(iter(self._samples))]  # Oldest first
+
+            samples = self.get_positions_at_times(times)
+            for xyz in samples:
+                xyz.flags.writeable = False
+            self._samples[key] = samples
 
-        return (x1, y1, z1), (x2, y2, z2)
+        return samples
 
 
 # Sample usage:
@@ -75,29 +187,29 @@ mars_parameters = {
 
 sun = CelestialBody("Sun", mass=1.989 * 10**30, orbital_parameters=sun_parameters)
 earth = CelestialBody("Earth", mass=5.972 * 10**24, orbital_parameters=earth_parameters)
-mars = CelestialBody("Earth", mass=5.972 * 10**24, orbital_parameters=mars_parameters)
+mars = CelestialBody("Mars", mass=5.972 * 10**24, orbital_parameters=mars_parameters)
 
 earth_system = StarSystem(sun, earth)
 mars_system = StarSystem(sun, mars)
 
-earth_x_coords, earth_y_coords, earth_z_coords = [], [], []
-mars_x_coords, mars_y_coords, mars_z_coords = [], [], []
+days = np.arange(365, dtype=float)  # A year (365 days)
 
-for day in range(365):  # Looping through a year (365 days)
-    _, earth_position = earth_system.get_positions(day)
-    earth_x_coords.append(earth_position[0])
-    earth_y_coords.append(earth_position[1])
-    earth_z_coords.append(earth_position[2])
+_, earth_xyz = earth_system.sample(days)
+_, mars_xyz = mars_system.sample(days)
 
-    _, mars_position = mars_system.get_positions(day)
-    mars_x_coords.append(mars_position[0])
-    mars_y_coords.append(mars_position[1])
-    mars_z_coords.append(mars_position[2])
+if CHECK:
+    # Half-way through each orbit a body is at apoapsis, a(1 + e) from the Sun along -x
+    for body in (earth, mars):
+        for k in range(20):
+            x, y, z = body.position_at_time((k + 0.5) * body.orbit_period)
+            if not (math.isclose(x, -body.semi_major_axis * (1 + body.eccentricity), rel_tol=1e-9)
+                    and abs(y) < 1e-9 and abs(z) < 1e-9):
+                sys.exit(f"{body.name} is not at apoapsis after {k + 0.5} orbits: {(x, y, z)}")
 
 # Plotting Y against X
 plt.figure(figsize=(10, 10))
-plt.plot(earth_x_coords, earth_y_coords, label="Earth's Orbit", color='blue')
-plt.plot(mars_x_coords, mars_y_coords, label="Mars' Orbit", color='red')
+plt.plot(earth_xyz[0], earth_xyz[1], label="Earth's Orbit", color='blue')
+plt.plot(mars_xyz[0], mars_xyz[1], label="Mars' Orbit", color='red')
 plt.scatter([0], [0], color='orange', s=200, label="Sun")  # Sun's position at the center
 plt.title("Orbits Around the Sun (Y vs X)")
 plt.xlabel('X (AU)')
@@ -105,12 +217,13 @@ plt.ylabel('Y (AU)')
 plt.grid(True)
 plt.legend()
 plt.gca().set_aspect('equal', adjustable='box')
-plt.show()
+if not HEADLESS:
+    plt.show()
 
 # Plotting Z against X
 plt.figure(figsize=(10, 10))
-plt.plot(earth_y_coords, earth_z_coords, label="Earth's Orbit", color='blue')
-plt.plot(mars_y_coords, mars_z_coords, label="Mars' Orbit", color='red')
+plt.plot(earth_xyz[1], earth_xyz[2], label="Earth's Orbit", color='blue')
+plt.plot(mars_xyz[1], mars_xyz[2], label="Mars' Orbit", color='red')
 plt.scatter([0], [0], color='orange', s=200, label="Sun")  # Sun's position at the center
 plt.title("Orbits Around the Sun (Z vs X)")
 plt.xlabel('X (AU)')
@@ -118,4 +231,5 @@ plt.ylabel('Z (AU)')
 plt.grid(True)
 plt.legend()
 plt.gca().set_aspect('equal', adjustable='box')
-plt.show()
+if not HEADLESS:
+    plt.show()
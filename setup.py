@@ -0,0 +1,27 @@
+"""
+Builds the optional C extensions used by cosmos.entities and
+cosmos.propagate:
+
+    python setup.py build_ext --inplace
+"""
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extensions = [
+    Extension('cosmos._kepler',
+              ['cosmos/_kepler.pyx'],
+              extra_compile_args=['-O3', '-march=native', '-ffast-math']),
+    Extension('cosmos._entities',
+              ['cosmos/_entities.pyx'],
+              extra_compile_args=['-O3'])
+]
+
+setup(
+    name='cosmos-ev',
+    packages=['cosmos'],
+    ext_modules=cythonize(extensions,
+                          compiler_directives={'boundscheck': False,
+                                               'wraparound': False,
+                                               'cdivision': True}),
+)
@@ -2,7 +2,50 @@
 Validation docstring
 """
 
-from cosmos.entities import CelestialBody
+import numpy as np
+
+from cosmos.entities import BodyTable, BodyType, CelestialBody
+
+# BodyTable columns checked by validate_table, and whether each must be
+# strictly positive (True) or only non-negative (False).
+_TABLE_CHECKS = (
+    ('semi_major_axis', False),
+    ('orbital_period', False),
+    ('rotation_period', False),
+    ('radius', True),
+)
+
+# Keys required by validate_general_info and validate_physical_properties, in
+# the order they are read, and as sets for finding the missing ones.
+_GENERAL_FIELDS = ('name', 'description', 'body_type', 'parent', 'satellites')
+_GENERAL_KEYS = frozenset(_GENERAL_FIELDS)
+_PHYSICAL_FIELDS = ('radius', 'axial_tilt')
+_PHYSICAL_KEYS = frozenset(_PHYSICAL_FIELDS)
+
+# Fields checked by validate_orbital_mechanics, in order, and whether each
+# must be non-negative (True) or may be any number (False).
+_ORBITAL_CHECKS = (
+    ('apogee', True),
+    ('perigee', True),
+    ('orbit_period', True),
+    ('rotation_period', True),
+    ('inclination', False),
+)
+_ORBITAL_KEYS = frozenset(key for key, _ in _ORBITAL_CHECKS)
+
+# Returned by next() when every satellite is a CelestialBody.
+_SENTINEL = object()
+
+# Exact types accepted as numbers without falling back to isinstance.
+_NUM = frozenset({int, float})
+
+
+def _is_number(value) -> bool:
+    """
+    Returns whether value is an int or float, checking the exact type first
+    so that plain numbers skip the isinstance call.
+    """
+    return type(value) in _NUM or isinstance(value, (int, float))
 
 
 class CelestialBodyValidation:
@@ -24,33 +67,41 @@ class CelestialBodyValidation:
         - ValueError: If any of the attributes do not meet their expected types
                       or if required attributes are missing.
         """
-        required_keys = ['name', 'description', 'body_type', 'parent',
-                         'satellites']
-        for key in required_keys:
-            if key not in general_info:
-                raise ValueError(f"'{key}' is missing in general_info")
+        missing = _GENERAL_KEYS - general_info.keys()
+        if missing:
+            raise ValueError(f"missing keys in general_info: "
+                             f"{sorted(missing)}")
 
-        if not isinstance(general_info['name'], str):
+        name, description, body_type, parent, satellites = (
+            general_info[key] for key in _GENERAL_FIELDS)
+
+        if not isinstance(name, str):
             raise ValueError("'name' should be of type str")
 
-        if not isinstance(general_info['description'], str):
+        if not isinstance(description, str):
             raise ValueError("'description' should be of type str")
 
-        if not isinstance(general_info['body_type'], str):
-            raise ValueError("'body_type' should be of type str")
+        if isinstance(body_type, str):
+            valid_body_type = body_type.upper() in BodyType.__members__
+        else:
+            valid_body_type = isinstance(body_type, BodyType)
+        if not valid_body_type:
+            raise ValueError("'body_type' should be a BodyType or the name "
+                             "of one")
 
-        parent = general_info['parent']
         if parent is not None and not isinstance(parent, CelestialBody):
             raise ValueError("'parent' should be either None or an "
                              "instance of CelestialBody")
 
-        if not isinstance(general_info['satellites'], list):
+        if not isinstance(satellites, list):
             raise ValueError("'satellites' should be a list")
 
-        for satellite in general_info['satellites']:
-            if not isinstance(satellite, CelestialBody):
-                raise ValueError("'satellites' list should only contain "
-                                 "instances of CelestialBody")
+        invalid = next((satellite for satellite in satellites
+                        if not isinstance(satellite, CelestialBody)),
+                       _SENTINEL)
+        if invalid is not _SENTINEL:
+            raise ValueError("'satellites' list should only contain "
+                             "instances of CelestialBody")
 
     @staticmethod
     def validate_orbital_mechanics(orbital_mechanics: dict) -> None:
@@ -66,30 +117,16 @@ class CelestialBodyValidation:
         - ValueError: If any of the attributes do not meet their expected types
                       or if required attributes are missing.
         """
-        required_keys = ['apogee', 'perigee', 'orbit_period',
-                         'rotation_period', 'inclination']
-        for key in required_keys:
-            if key not in orbital_mechanics:
-                raise ValueError(f"'{key}' is missing in orbital_mechanics")
-
-        if not isinstance(orbital_mechanics['apogee'], (int, float)) or \
-           orbital_mechanics['apogee'] < 0:
-            raise ValueError("'apogee' should be a positive number")
+        missing = _ORBITAL_KEYS - orbital_mechanics.keys()
+        if missing:
+            raise ValueError(f"missing keys in orbital_mechanics: "
+                             f"{sorted(missing)}")
 
-        if not isinstance(orbital_mechanics['perigee'], (int, float)) or \
-           orbital_mechanics['perigee'] < 0:
-            raise ValueError("'perigee' should be a positive number")
-
-        if not isinstance(orbital_mechanics['orbit_period'], (int, float)) \
-           or orbital_mechanics['orbit_period'] < 0:
-            raise ValueError("'orbit_period' should be a positive number")
-
-        if not isinstance(orbital_mechanics['rotation_period'], (int, float))\
-           or orbital_mechanics['rotation_period'] < 0:
-            raise ValueError("'rotation_period' should be a positive number")
-
-        if not isinstance(orbital_mechanics['inclination'], (int, float)):
-            raise ValueError("'inclination' should be a number")
+        for key, non_negative in _ORBITAL_CHECKS:
+            value = orbital_mechanics[key]
+            if not _is_number(value) or (non_negative and value < 0):
+                kind = 'a positive number' if non_negative else 'a number'
+                raise ValueError(f"'{key}' should be {kind}")
 
     @staticmethod
     def validate_physical_properties(physical_properties: dict) -> None:
@@ -104,14 +141,37 @@ class CelestialBodyValidation:
         - ValueError: If any of the attributes do not meet their expected types
                       or if required attributes are missing.
         """
-        required_keys = ['radius', 'axial_tilt']
-        for key in required_keys:
-            if key not in physical_properties:
-                raise ValueError(f"'{key}' is missing in physical_properties")
+        missing = _PHYSICAL_KEYS - physical_properties.keys()
+        if missing:
+            raise ValueError(f"missing keys in physical_properties: "
+                             f"{sorted(missing)}")
+
+        radius, axial_tilt = (physical_properties[key]
+                              for key in _PHYSICAL_FIELDS)
 
-        if not isinstance(physical_properties['radius'], (int, float)) or \
-           physical_properties['radius'] <= 0:
+        if not _is_number(radius) or radius <= 0:
             raise ValueError("'radius' should be a positive number")
 
-        if not isinstance(physical_properties['axial_tilt'], (int, float)):
+        if not _is_number(axial_tilt):
             raise ValueError("'axial_tilt' should be a number")
+
+    @staticmethod
+    def validate_table(table: BodyTable) -> None:
+        """
+        Validates the numeric fields of every body in a BodyTable at once,
+        with one vectorised comparison per field.
+
+        Parameters:
+        - table (BodyTable): The table to validate, e.g. StarSystem.table.
+
+        Raises:
+        - ValueError: If any body has an out of range value. The message
+                      names the field and the id of the first such body.
+        """
+        for name, strictly_positive in _TABLE_CHECKS:
+            column = table.column(name)
+            invalid = column <= 0 if strictly_positive else column < 0
+            if invalid.any():
+                body_id = int(np.argmax(invalid))
+                raise ValueError(f"'{name}' should be a positive number "
+                                 f"(body {body_id})")